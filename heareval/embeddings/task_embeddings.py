@@ -44,6 +44,10 @@ import heareval.gpu_max_mem as gpu_max_mem
 TORCH = "torch"
 TENSORFLOW = "tf"
 
+# heareval.multigpu runs one embedding process per GPU, each seeing a single
+# device, so this must stay small rather than scale with the CPU count.
+NUM_WORKERS = min(4, (os.cpu_count() or 1) // 2)
+
 
 class Embedding:
     """
@@ -104,7 +108,7 @@ class Embedding:
             if isinstance(x, np.ndarray):
                 x = torch.tensor(x, device=self.device)
             elif isinstance(x, torch.Tensor):
-                x = x.to(self.device)
+                x = x.to(self.device, non_blocking=True)
             else:
                 raise TypeError(
                     "Input must be one of np.ndarray or torch.Tensor for"
@@ -197,10 +201,16 @@ def get_dataloader_for_embedding(
     data: Dict, audio_dir: Path, embedding: Embedding, batch_size: int = 64
 ):
     if embedding.type == TORCH or embedding.type == TENSORFLOW:
+        # Pinned batches can be copied to the GPU asynchronously
+        pin_memory = embedding.type == TORCH and embedding.device == "cuda"
+        # Workers decode audio in __getitem__ while the model runs
+        num_workers = NUM_WORKERS if embedding.type == TORCH else 0
         return DataLoader(
             AudioFileDataset(data, audio_dir, embedding.sample_rate),
             batch_size=batch_size,
             shuffle=False,
+            pin_memory=pin_memory,
+            num_workers=num_workers,
         )
 
     else:
@@ -20,9 +20,8 @@ import pickle
 import random
 import sys
 import time
-from collections import defaultdict
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import more_itertools
 import numpy as np
@@ -311,17 +310,14 @@ class AbstractPredictionModel(pl.LightningModule):
         dont_stack: List[str] = [],
     ) -> Dict:
         # ) -> Dict[str, Union[torch.Tensor, List[str]]]:
-        flat_outputs_default: DefaultDict = defaultdict(list)
         for output in outputs:
             assert set(output.keys()) == set(keys), f"{output.keys()} != {keys}"
-            for key in keys:
-                flat_outputs_default[key] += output[key]
-        flat_outputs = dict(flat_outputs_default)
+        flat_outputs: Dict = {}
         for key in keys:
             if key in dont_stack:
-                continue
+                flat_outputs[key] = [x for output in outputs for x in output[key]]
             else:
-                flat_outputs[key] = torch.stack(flat_outputs[key])
+                flat_outputs[key] = torch.cat([output[key] for output in outputs])
         return flat_outputs
 
     def configure_optimizers(self):
@@ -439,7 +435,7 @@ class EventPredictionModel(AbstractPredictionModel):
         flat_outputs = self._flatten_batched_outputs(
             outputs,
             keys=["target", "prediction", "prediction_logit", "filename", "timestamp"],
-            # This is a list of string, not tensor, so we don't need to stack it
+            # This is a list of string, not tensor, so flatten it into a list
             dont_stack=["filename"],
         )
         target, prediction, prediction_logit, filename, timestamp = (
@@ -567,9 +563,7 @@ class SplitMemmapDataset(Dataset):
             shape=self.dim,
         )
         if in_memory:
-            self.embeddings = torch.stack(
-                [torch.tensor(e) for e in tqdm(self.embeddings)]
-            )
+            self.embeddings = torch.from_numpy(np.array(self.embeddings))
             nandim = self.embeddings.isnan().sum().tolist()
             infdim = self.embeddings.isinf().sum().tolist()
             assert nandim == 0 and infdim == 0
@@ -599,12 +593,10 @@ class SplitMemmapDataset(Dataset):
         This allows us to have tensors that are all the same shape.
         Later we reduce this with an argmax to get the vocabulary indices.
         """
-        ys = []
+        self.y = torch.zeros((len(self.labels), self.nlabels), dtype=torch.float)
         for idx in tqdm(range(len(self.labels))):
             labels = [self.label_to_idx[str(label)] for label in self.labels[idx]]
-            y = label_to_binary_vector(labels, self.nlabels)
-            ys.append(y)
-        self.y = torch.stack(ys)
+            self.y[idx] = label_to_binary_vector(labels, self.nlabels)
         assert self.y.shape == (len(self.labels), self.nlabels)
 
     def __len__(self) -> int: